@@ -11,13 +11,165 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import (
+    TimeoutException, StaleElementReferenceException, WebDriverException,
+    NoSuchElementException,
+)
 from webdriver_manager.chrome import ChromeDriverManager
+try:
+    import httpx
+except ImportError:
+    httpx = None
+import asyncio
+import base64
+import atexit
+import functools
+import hashlib
+import json
+import logging
+import logging.handlers
+import multiprocessing
+import multiprocessing.util
+import os
+import queue
+import re
+import sys
 import time
+import urllib.parse
+import shelve
+
+
+logger = logging.getLogger(__name__)
+
+# Case-insensitive alternation of every marker the result checks look at, so a
+# page is scanned once. The matched text keeps its case for the exact-case checks.
+RESULT_MARKER_PATTERN = "ei tuloksia|ei löytynyt|yhteensä|osumaa|termit"
+_RESULT_MARKER_RE = re.compile(RESULT_MARKER_PATTERN, re.IGNORECASE)
+
+# Result classification run inside the browser on the text of the results
+# area (falling back to the whole page). Returns "found" or "not found".
+RESULT_STATUS_SCRIPT = """
+const root = document.querySelector("main") || document.body;
+const text = root ? root.innerText : "";
+const hits = new Set();
+for (const match of text.matchAll(new RegExp("%s", "gi"))) hits.add(match[0]);
+const lowerHits = new Set([...hits].map(hit => hit.toLowerCase()));
+// Primary check: "Ei tuloksia" (No results) indicates not found
+if (hits.has("Ei tuloksia")) return "not found";
+// Secondary check: "Yhteensä 305 osumaa haulla lääkäri" indicates results were found
+if (hits.has("Yhteensä") && hits.has("osumaa")) return "found";
+// Tertiary check: dictionary section headers ("Lääketieteen termit") appear with results
+if (lowerHits.has("termit")) return "found";
+if (lowerHits.has("ei tuloksia") || lowerHits.has("ei löytynyt")) return "not found";
+// Default to "found" if no clear "not found" indicator
+return "found";
+""" % RESULT_MARKER_PATTERN
+
+# Remembers the results shown before a new term is submitted, since the page
+# is no longer reloaded between searches
+MARK_PREVIOUS_RESULTS_SCRIPT = """
+const root = document.querySelector("main") || document.body;
+window.__previousResults = root ? root.innerText : "";
+"""
+
+# Returns true once results for the term (arguments[0]) are shown: a result
+# marker or container is present, and the hit header names the term or the
+# results differ from the ones marked before submitting
+RESULTS_READY_SCRIPT = r"""
+const root = document.querySelector("main") || document.body;
+const text = root ? root.innerText : "";
+const hasResults = text.includes("Ei tuloksia") || text.includes("osumaa")
+    || document.querySelector("div.search-results, section.hits") !== null;
+if (!hasResults) return false;
+// The term must be the whole header value: "haulla kirja" must not match
+// the previous "haulla kirjasto"
+const escaped = arguments[0].trim().replace(/[.*+?^${}()|[\]\\]/g, "\\$&");
+const header = new RegExp("haulla\\s+[\"'“”]?" + escaped + "[\"'“”]?(?![\\p{L}\\p{N}])", "iu");
+if (header.test(text)) return true;
+return text !== window.__previousResults;
+"""
+
+
+# Concurrent requests made by search_terms_async
+HTTP_CONCURRENCY = 8
+
+
+def classify_result_text(text, default="found"):
+    """
+    Decide from the text of a result page whether the term was found.
+    Mirrors RESULT_STATUS_SCRIPT for pages fetched without a browser.
+    
+    Args:
+        text (str): Page text or HTML
+        default (str): Status when the text has no result marker at all
+        
+    Returns:
+        str: "found", "not found" or the default
+    """
+    # Collect every marker in a single pass over the text
+    hits = {match.group(0) for match in _RESULT_MARKER_RE.finditer(text)}
+    lower_hits = {hit.lower() for hit in hits}
+    
+    # Primary check: "Ei tuloksia" (No results) indicates not found
+    if "Ei tuloksia" in hits:
+        return "not found"
+    
+    # Secondary check: "Yhteensä 305 osumaa haulla lääkäri" indicates results were found
+    if "Yhteensä" in hits and "osumaa" in hits:
+        return "found"
+    
+    # Tertiary check: dictionary section headers ("Lääketieteen termit") appear with results
+    if "termit" in lower_hits:
+        return "found"
+    
+    # If we can't determine, check for "not found" indicators more broadly
+    if "ei tuloksia" in lower_hits or "ei löytynyt" in lower_hits:
+        return "not found"
+    
+    # Default to "found" if no clear "not found" indicator
+    return default
+
+
+# URL of the dictionary's search API request, read when use_search_api is enabled
+SEARCH_API_PATTERN = r"/apps/sanakirjat/.*(search|haku)"
+
+# Requests the browser never makes: tracking, ads and web fonts aren't needed for the result text
+BLOCKED_URL_PATTERNS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*hotjar.com*",
+    "*.woff2",
+    "*.woff",
+]
+
+# Seconds a pooled browser may sit idle before its login is no longer trusted
+POOLED_SESSION_TTL = 10 * 60
+
+# Connections kept open per WebDriver client to ChromeDriver
+WEBDRIVER_POOL_MAXSIZE = 20
+
+
+@functools.lru_cache(maxsize=None)
+def _get_chromedriver_path():
+    """
+    Resolve the ChromeDriver binary with webdriver_manager, once per process.
+    
+    Returns:
+        str: Path to the ChromeDriver executable
+    """
+    # Keep webdriver_manager quiet (WDM_LOG in 4.x, WDM_LOG_LEVEL in 3.x)
+    os.environ.setdefault("WDM_LOG", "0")
+    os.environ.setdefault("WDM_LOG_LEVEL", "0")
+    return ChromeDriverManager().install()
 
 
 class MedicalDictionaryScraper:
-    def __init__(self, email, password, headless=True):
+    # Idle browsers left behind by closed scrapers, keyed by _pool_key().
+    # Each entry is a (driver, is_logged_in, released_at) tuple.
+    _sessions_by_creds = {}
+    
+    def __init__(self, email, password, headless=True, cache_path=None, use_search_api=False):
         """
         Initialize the scraper with Chrome WebDriver.
         
@@ -25,14 +177,62 @@ class MedicalDictionaryScraper:
             email (str): Login email address
             password (str): Login password
             headless (bool): Run browser in headless mode (no GUI)
+            cache_path (str): Optional file to persist search results between runs
+            use_search_api (bool): Read the hit count from the search API response
+                (matching SEARCH_API_PATTERN) instead of waiting for the page to render,
+                falling back to the page text when no such response is seen
         """
         self.url = "https://www.terveysportti.fi/apps/sanakirjat/"
         self.email = email
         self.password = password
+        self.headless = headless
+        self.use_search_api = use_search_api
         self.is_logged_in = False
+        self.search_input = None
+        # CDP request IDs of search API calls made by the current search
+        self._api_request_ids = set()
+        
+        # Results keyed by normalized term, optionally persisted to disk
+        self._cache = shelve.open(cache_path) if cache_path else {}
+        
+        # Reuse a warm browser from a previous scraper with the same credentials
+        try:
+            self.driver = self._take_pooled_driver()
+            if self.driver is None:
+                self.driver = self._create_driver()
+        except BaseException:
+            # close() is never reached if the constructor fails
+            if isinstance(self._cache, shelve.Shelf):
+                self._cache.close()
+            raise
+        # Explicit waits reused for every lookup, and a longer one for the login redirect
+        self.wait = self._tuned_wait(10)
+        self._login_wait = self._tuned_wait(15)
+    
+    def _tuned_wait(self, timeout):
+        """
+        Build an explicit wait with a short poll interval.
+        
+        Args:
+            timeout (float): Seconds to wait before giving up
+            
+        Returns:
+            WebDriverWait: The wait bound to this scraper's driver
+        """
+        return WebDriverWait(
+            self.driver, timeout, poll_frequency=0.1,
+            ignored_exceptions=(StaleElementReferenceException, NoSuchElementException)
+        )
+    
+    def _create_driver(self):
+        """
+        Start a new Chrome WebDriver.
         
+        Returns:
+            webdriver.Chrome: The new driver
+        """
         chrome_options = Options()
-        if headless:
+        if self.headless:
             chrome_options.add_argument("--headless")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
@@ -40,10 +240,131 @@ class MedicalDictionaryScraper:
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         
+        # Only the page text is needed, so skip images and notification prompts
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+        # Return from driver.get() on DOMContentLoaded instead of the full load event
+        chrome_options.page_load_strategy = "eager"
+        
+        if self.use_search_api:
+            # Record network events so search API responses can be picked up
+            chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+            chrome_options.add_experimental_option("perfLoggingPrefs", {
+                "enableNetwork": True,
+                "enablePage": False,
+            })
+        
         # Use webdriver_manager to automatically get the correct ChromeDriver version
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        self.wait = WebDriverWait(self.driver, 10)
+        service = Service(_get_chromedriver_path())
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+        # Rely on explicit waits only, so failed lookups never block on an implicit wait
+        driver.implicitly_wait(0)
+        self._block_urls(driver)
+        self._widen_connection_pool(driver)
+        return driver
+    
+    @staticmethod
+    def _block_urls(driver):
+        """
+        Skip analytics, ad and web font requests on every page load.
+        CDP settings only apply to the current tab, so call this again for each new tab.
+        
+        Args:
+            driver (webdriver.Chrome): The driver, switched to the tab to configure
+        """
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    
+    @staticmethod
+    def _widen_connection_pool(driver):
+        """
+        Let the WebDriver client keep more than one connection to ChromeDriver alive.
+        
+        Selenium's urllib3 pool defaults to a single connection, so overlapping
+        commands drop and reopen sockets ("connection pool is full").
+        
+        Args:
+            driver (webdriver.Chrome): The driver to configure
+        """
+        pool_manager = getattr(driver.command_executor, "_conn", None)
+        if pool_manager is None:
+            return
+        pool_manager.connection_pool_kw.update(maxsize=WEBDRIVER_POOL_MAXSIZE, block=False)
+        # Drop the pool created during session start so the next command builds a larger one
+        pool_manager.clear()
+    
+    def _pool_key(self):
+        """Key under which this scraper's idle browsers are pooled."""
+        # Include the password so wrong credentials never borrow another scraper's login
+        password_hash = hashlib.sha256(self.password.encode("utf-8")).hexdigest()
+        return (self.email, password_hash, self.headless, self.use_search_api)
+    
+    def _take_pooled_driver(self):
+        """
+        Take a still-running browser from the session pool.
+        
+        Returns:
+            webdriver.Chrome: A pooled driver, or None if none is available
+        """
+        sessions = self._sessions_by_creds.get(self._pool_key())
+        while sessions is not None:
+            try:
+                driver, is_logged_in, released_at = sessions.get_nowait()
+            except queue.Empty:
+                return None
+            try:
+                driver.current_url
+            except WebDriverException:
+                # The browser died while idle, try the next one
+                continue
+            
+            if is_logged_in and time.monotonic() - released_at > POOLED_SESSION_TTL:
+                # The server session may have expired while idle; start from a clean
+                # state so the next search logs in again
+                try:
+                    driver.delete_all_cookies()
+                except WebDriverException:
+                    continue
+                is_logged_in = False
+            self.is_logged_in = is_logged_in
+            return driver
+        return None
+    
+    @classmethod
+    def close_pooled_drivers(cls):
+        """Quit every idle browser in the session pool."""
+        for sessions in cls._sessions_by_creds.values():
+            while True:
+                try:
+                    driver, _, _ = sessions.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    driver.quit()
+                except WebDriverException:
+                    pass
+    
+    def bootstrap_cookies(self, path=None):
+        """
+        Log in with the browser once and export the session cookies,
+        so searches can be made over plain HTTP with search_terms_async.
+        
+        Args:
+            path (str): Optional JSON file to save the cookies to
+            
+        Returns:
+            dict: Cookie names mapped to values, or None if login failed
+        """
+        if not self.is_logged_in and not self.login():
+            return None
+        
+        cookies = {cookie["name"]: cookie["value"] for cookie in self.driver.get_cookies()}
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(cookies, f)
+        return cookies
     
     def login(self):
         """
@@ -53,25 +374,24 @@ class MedicalDictionaryScraper:
             bool: True if login successful, False otherwise
         """
         try:
-            print("Navigating to website...")
+            logger.debug("Navigating to website...")
             self.driver.get(self.url)
             
             # Wait for and click the login button (Kirjaudu)
-            print("Clicking login button...")
+            logger.debug("Clicking login button...")
             login_button = self.wait.until(
                 EC.element_to_be_clickable((By.XPATH, "//a[contains(@href, '/apps/duoauth/auth')]"))
             )
             login_button.click()
             
             # Wait for login form to appear
-            print("Waiting for login form...")
-            time.sleep(2)
-            
-            # Enter username/email
-            print("Entering credentials...")
+            logger.debug("Waiting for login form...")
             username_input = self.wait.until(
                 EC.presence_of_element_located((By.ID, "username"))
             )
+            
+            # Enter username/email
+            logger.debug("Entering credentials...")
             username_input.clear()
             username_input.send_keys(self.email)
             
@@ -81,25 +401,30 @@ class MedicalDictionaryScraper:
             password_input.send_keys(self.password)
             
             # Click login button
-            print("Submitting login form...")
+            logger.debug("Submitting login form...")
             login_submit = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
             login_submit.click()
             
             # Wait for redirect back to dictionary page
-            print("Waiting for login to complete...")
-            time.sleep(5)
-            
-            # Check if we're back at the dictionary page
-            if "sanakirjat" in self.driver.current_url:
-                print("✓ Login successful!")
-                self.is_logged_in = True
-                return True
-            else:
-                print("✗ Login may have failed - unexpected URL")
+            logger.debug("Waiting for login to complete...")
+            try:
+                # Match the start of the URL: the login page may carry the
+                # dictionary address in its redirect parameter
+                self._login_wait.until(
+                    EC.url_matches("^" + re.escape(self.url.rstrip("/")))
+                )
+            except TimeoutException:
+                logger.warning("✗ Login may have failed - unexpected URL")
                 return False
+            
+            # Only count the login once the dictionary is usable, so a failure here is retried
+            self._ensure_on_search_page()
+            logger.info("✓ Login successful!")
+            self.is_logged_in = True
+            return True
                 
         except Exception as e:
-            print(f"Error during login: {str(e)}")
+            logger.error("Error during login: %s", e)
             return False
     
     def search_term(self, term):
@@ -113,87 +438,385 @@ class MedicalDictionaryScraper:
             str: "found" or "not found"
         """
         try:
-            # Navigate to the website
-            self.driver.get(self.url)
+            if self.use_search_api:
+                # Navigate first if needed, then discard network events from that
+                # navigation and earlier searches
+                self._ensure_on_search_page()
+                self.driver.get_log("performance")
+                self._api_request_ids = set()
+                self._submit_search(term)
+                return self.wait.until(functools.partial(self._api_or_page_result, term=term))
+            
+            self._submit_search(term)
+            return self._read_result(term)
             
-            # Wait for the search input to be present
-            search_input = self.wait.until(
+        except TimeoutException:
+            logger.warning("Timeout while searching for term: %s", term)
+            return "error"
+        except Exception as e:
+            logger.error("Error searching for term '%s': %s", term, e)
+            return "error"
+    
+    def _session_alive(self):
+        """
+        Check whether the browser session is still usable.
+        
+        Returns:
+            bool: True if the driver still responds, False otherwise
+        """
+        try:
+            # Match the start of the URL: an expired session sits on the login
+            # page, which carries the dictionary address in its redirect parameter
+            return self.driver.current_url.startswith(self.url.rstrip("/"))
+        except WebDriverException:
+            return False
+    
+    def _ensure_on_search_page(self):
+        """
+        Make sure the dictionary page is loaded and the search input is cached.
+        Only navigates when the session has been lost or left the dictionary.
+        
+        Returns:
+            WebElement: The search input element
+        """
+        if not self._session_alive():
+            self.driver.get(self.url)
+            self.search_input = None
+        
+        if self.search_input is None:
+            self.search_input = self.wait.until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='search'], input.form-control"))
             )
+        return self.search_input
+    
+    @staticmethod
+    def _results_ready(term):
+        """
+        Expected condition: a "no results" message, a hit count or a result container
+        is shown for the term, not left over from the previous search.
+        
+        Args:
+            term (str): The submitted term
             
-            # Clear and enter the search term
+        Returns:
+            callable: Condition returning True once the search results have rendered
+        """
+        def condition(driver):
+            return driver.execute_script(RESULTS_READY_SCRIPT, term)
+        return condition
+    
+    def _submit_search(self, term):
+        """
+        Clear the search input and submit a new term.
+        
+        Args:
+            term (str): The term to submit
+        """
+        # Reuse the already-loaded search input instead of reloading the page
+        try:
+            search_input = self._ensure_on_search_page()
+            self.driver.execute_script(MARK_PREVIOUS_RESULTS_SCRIPT)
             search_input.clear()
-            search_input.send_keys(term)
-            search_input.send_keys(Keys.RETURN)
-            
-            # Wait a bit for results to load
-            time.sleep(3)
+            search_input.send_keys(term + Keys.RETURN)
+        except StaleElementReferenceException:
+            # The results render may have replaced the input; look it up again once
+            self.search_input = None
+            search_input = self._ensure_on_search_page()
+            self.driver.execute_script(MARK_PREVIOUS_RESULTS_SCRIPT)
+            search_input.clear()
+            search_input.send_keys(term + Keys.RETURN)
+    
+    def _read_result(self, term):
+        """
+        Wait for the results of the submitted search and classify them.
+        
+        Args:
+            term (str): The submitted term
             
-            # Get page source for checking
-            page_source = self.driver.page_source
+        Returns:
+            str: "found" or "not found"
+        """
+        # Wait until a result marker appears instead of sleeping a fixed time
+        self.wait.until(self._results_ready(term))
+        
+        # Classify the results in the browser so only a short status string
+        # crosses the WebDriver wire instead of the serialized DOM
+        return self.driver.execute_script(RESULT_STATUS_SCRIPT)
+    
+    def _api_or_page_result(self, driver, term):
+        """
+        Expected condition: the status from the search API response, or from the
+        page text once it has rendered, whichever comes first.
+        
+        Args:
+            driver: The WebDriver instance
+            term (str): The submitted term
             
-            # Primary check: "Ei tuloksia" (No results) indicates not found
-            if "Ei tuloksia" in page_source:
-                return "not found"
+        Returns:
+            str: "found" or "not found", or False while still waiting
+        """
+        for entry in driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            params = message.get("params", {})
+            if message["method"] == "Network.requestWillBeSent":
+                if self._is_api_request_for(params["request"], term):
+                    self._api_request_ids.add(params["requestId"])
+            elif message["method"] == "Network.loadingFinished":
+                if params["requestId"] in self._api_request_ids:
+                    self._api_request_ids.discard(params["requestId"])
+                    status = self._status_from_api_response(params["requestId"])
+                    if status:
+                        return status
+            elif message["method"] == "Network.loadingFailed":
+                self._api_request_ids.discard(params.get("requestId"))
+        
+        # Give a search API response that is still loading priority over the page;
+        # the page is only used when none was seen or its body had no hit count
+        if self._api_request_ids:
+            return False
+        if self._results_ready(term)(driver):
+            return driver.execute_script(RESULT_STATUS_SCRIPT)
+        return False
+    
+    @staticmethod
+    def _is_api_request_for(request, term):
+        """
+        Check whether a CDP request is a search API call for the full term,
+        not a suggestion request for a prefix typed on the way.
+        
+        Args:
+            request (dict): The "request" of a Network.requestWillBeSent event
+            term (str): The submitted term
             
-            # Secondary check: "Yhteensä" (Total) indicates results were found
-            # Example: "Yhteensä 305 osumaa haulla lääkäri"
-            if "Yhteensä" in page_source and "osumaa" in page_source:
-                return "found"
+        Returns:
+            bool: True if the request searches for the term
+        """
+        if not re.search(SEARCH_API_PATTERN, request["url"]):
+            return False
+        sent = urllib.parse.unquote_plus(request["url"] + " " + request.get("postData", ""))
+        return term.strip().casefold() in sent.casefold()
+    
+    def _status_from_api_response(self, request_id):
+        """
+        Read a search API response body and classify it by its hit count.
+        
+        Args:
+            request_id (str): CDP network request ID
             
-            # Tertiary check: Look for dictionary section headers which appear with results
-            if "Lääketieteen termit" in page_source or "termit" in page_source.lower():
-                return "found"
+        Returns:
+            str: "found" or "not found", or None if the body has no hit count
+        """
+        try:
+            response = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+            body = response["body"]
+            if response.get("base64Encoded"):
+                body = base64.b64decode(body).decode("utf-8")
+            data = json.loads(body)
+        except (WebDriverException, ValueError):
+            return None
+        
+        total_hits = data.get("totalHits") if isinstance(data, dict) else None
+        if not isinstance(total_hits, int):
+            return None
+        return "found" if total_hits > 0 else "not found"
+    
+    def _search_in_tabs(self, terms, tabs):
+        """
+        Search terms in batches using several tabs of the same browser:
+        one term is submitted per tab, then each tab is visited for its result.
+        
+        Args:
+            terms (list): Terms to search
+            tabs (int): Number of tabs to use
             
-            # If we can't determine, check for "not found" indicators more broadly
-            page_source_lower = page_source.lower()
-            if "ei tuloksia" in page_source_lower or "ei löytynyt" in page_source_lower:
-                return "not found"
+        Returns:
+            dict: Dictionary mapping terms to their status
+        """
+        main_handle = self.driver.current_window_handle
+        handles = [main_handle]
+        # Each tab has its own search input
+        search_inputs = {main_handle: self.search_input}
+        statuses = {}
+        try:
+            for _ in range(tabs - 1):
+                self.driver.switch_to.new_window("tab")
+                handles.append(self.driver.current_window_handle)
+                self._block_urls(self.driver)
             
-            # Default to "found" if no clear "not found" indicator
-            # This is safer than defaulting to "not found"
-            return "found"
+            for start in range(0, len(terms), tabs):
+                batch = list(zip(handles, terms[start:start + tabs]))
+                
+                # Submit every term of the batch without waiting for results
+                submitted = []
+                for offset, (handle, term) in enumerate(batch, 1):
+                    logger.info("Searching %d/%d: %s", start + offset, len(terms), term)
+                    self.driver.switch_to.window(handle)
+                    self.search_input = search_inputs.get(handle)
+                    try:
+                        self._submit_search(term)
+                        submitted.append((handle, term))
+                    except Exception as e:
+                        logger.error("Error searching for term '%s': %s", term, e)
+                        statuses[term] = "error"
+                    search_inputs[handle] = self.search_input
+                
+                # Then collect the results tab by tab
+                for handle, term in submitted:
+                    self.driver.switch_to.window(handle)
+                    try:
+                        statuses[term] = self._read_result(term)
+                    except TimeoutException:
+                        logger.warning("Timeout while searching for term: %s", term)
+                        statuses[term] = "error"
+                    except Exception as e:
+                        logger.error("Error searching for term '%s': %s", term, e)
+                        statuses[term] = "error"
+        finally:
+            self.search_input = search_inputs.get(main_handle)
+            # Don't let a dead browser hide the original error while cleaning up
+            for handle in handles[1:]:
+                try:
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+                except WebDriverException:
+                    pass
+            try:
+                self.driver.switch_to.window(main_handle)
+            except WebDriverException:
+                pass
+        
+        return statuses
+    
+    @staticmethod
+    def _cache_key(term):
+        """
+        Normalize a term so that case and surrounding whitespace don't cause cache misses.
+        
+        Args:
+            term (str): The search term
             
-        except TimeoutException:
-            print(f"Timeout while searching for term: {term}")
-            return "error"
-        except Exception as e:
-            print(f"Error searching for term '{term}': {str(e)}")
-            return "error"
+        Returns:
+            str: The normalized cache key
+        """
+        return term.strip().casefold()
     
-    def search_multiple_terms(self, terms):
+    def search_multiple_terms(self, terms, workers=1, tabs=1):
         """
         Search for multiple terms and return results as a dictionary.
         Automatically logs in if not already logged in.
         
         Args:
             terms (list): List of Finnish medical terms to search
+            workers (int): Number of browser processes to search with in parallel.
+                Use None to pick half of the available CPUs.
+            tabs (int): Number of browser tabs to search with at once when
+                searching in a single browser (workers=1)
             
         Returns:
             dict: Dictionary mapping terms to their status ("found" or "not found")
+            
+        Raises:
+            ValueError: If both tabs and workers ask for parallel searches
         """
-        # Login first if not already logged in
-        if not self.is_logged_in:
-            if not self.login():
-                print("Failed to login. Cannot proceed with searches.")
-                return {term: "error" for term in terms}
+        if tabs > 1 and workers != 1:
+            raise ValueError("tabs can only be used with workers=1")
         
-        results = {}
+        # Only search each normalized term once and skip the ones already cached
+        pending = {}
+        for term in terms:
+            key = self._cache_key(term)
+            if key not in self._cache:
+                pending.setdefault(key, term)
+        
+        if workers is None:
+            workers = max(1, multiprocessing.cpu_count() // 2)
+        workers = min(workers, len(pending))
         
-        for i, term in enumerate(terms, 1):
-            print(f"Searching {i}/{len(terms)}: {term}")
-            status = self.search_term(term)
-            results[term] = status
+        if workers > 1:
+            statuses = self._search_in_pool(list(pending.values()), workers)
+        else:
+            # Login first if not already logged in
+            if pending and not self.is_logged_in:
+                if not self.login():
+                    logger.error("Failed to login. Cannot proceed with searches.")
+                    return {
+                        term: self._cache.get(self._cache_key(term), "error")
+                        for term in terms
+                    }
             
-            # Small delay between searches to be respectful to the server
-            time.sleep(1)
+            tabs = min(tabs, len(pending))
+            if tabs > 1:
+                statuses = self._search_in_tabs(list(pending.values()), tabs)
+            else:
+                statuses = {}
+                for i, term in enumerate(pending.values(), 1):
+                    logger.info("Searching %d/%d: %s", i, len(pending), term)
+                    statuses[term] = self.search_term(term)
         
+        for key, term in pending.items():
+            # Don't remember errors so they are retried next time
+            if statuses[term] != "error":
+                self._cache[key] = statuses[term]
+        
+        results = {}
+        for term in terms:
+            key = self._cache_key(term)
+            results[term] = self._cache[key] if key in self._cache else statuses[pending[key]]
         return results
     
-    def close(self):
-        """Close the browser."""
+    def _search_in_pool(self, terms, workers):
+        """
+        Search terms in parallel, each worker process using its own logged-in browser.
+        
+        Args:
+            terms (list): Terms to search
+            workers (int): Number of worker processes
+            
+        Returns:
+            dict: Dictionary mapping terms to their status
+        """
+        logger.info("Searching %d terms with %d browsers...", len(terms), workers)
+        statuses = {}
+        pool = multiprocessing.Pool(
+            workers,
+            initializer=_worker_init,
+            initargs=(self.email, self.password, self.headless, self.use_search_api),
+        )
+        try:
+            for i, (term, status) in enumerate(pool.imap_unordered(_worker_search, terms), 1):
+                logger.info("Searched %d/%d: %s", i, len(terms), term)
+                statuses[term] = status
+            # Let the workers exit normally so their browsers are closed
+            pool.close()
+            pool.join()
+        except BaseException:
+            pool.terminate()
+            raise
+        return statuses
+    
+    def close(self, keep_alive=True):
+        """
+        Release the browser and close the result cache.
+        
+        Args:
+            keep_alive (bool): Return a still-running browser to the session pool
+                for the next scraper with the same credentials instead of quitting it
+        """
         if self.driver:
-            self.driver.quit()
+            try:
+                if keep_alive:
+                    # Raises if the browser is no longer running
+                    self.driver.current_url
+                    self._sessions_by_creds.setdefault(self._pool_key(), queue.Queue()).put(
+                        (self.driver, self.is_logged_in, time.monotonic())
+                    )
+                else:
+                    self.driver.quit()
+            except WebDriverException:
+                pass
+            self.driver = None
+        if isinstance(self._cache, shelve.Shelf):
+            self._cache.close()
     
     def __enter__(self):
         """Context manager entry."""
@@ -204,8 +827,150 @@ class MedicalDictionaryScraper:
         self.close()
 
 
+# Scraper owned by the current worker process of a search pool
+_worker_scraper = None
+
+
+def _worker_init(email, password, headless, use_search_api):
+    """
+    Pool initializer: start a browser for this worker process and log in once.
+    
+    Args:
+        email (str): Login email address
+        password (str): Login password
+        headless (bool): Run browser in headless mode (no GUI)
+        use_search_api (bool): Read results from the search API response
+    """
+    global _worker_scraper
+    # A forked worker inherits the parent's pool of idle browsers; those sessions
+    # belong to the parent, so forget them instead of driving (and quitting) them here
+    MedicalDictionaryScraper._sessions_by_creds = {}
+    try:
+        _worker_scraper = MedicalDictionaryScraper(
+            email, password, headless=headless, use_search_api=use_search_api
+        )
+    except Exception as e:
+        # Raising here would kill the worker, and the pool would keep respawning it
+        # while imap_unordered waits forever; report errors from _worker_search instead
+        logger.error("Could not start browser in worker: %s", e)
+        _worker_scraper = None
+        return
+    # Close the browser when the worker process exits
+    multiprocessing.util.Finalize(
+        None, _worker_scraper.close, kwargs={"keep_alive": False}, exitpriority=10
+    )
+    _worker_scraper.login()
+
+
+def _worker_search(term):
+    """
+    Search a single term with this worker's scraper.
+    
+    Args:
+        term (str): The term to search
+        
+    Returns:
+        tuple: (term, status)
+    """
+    if _worker_scraper is None:
+        return term, "error"
+    if not _worker_scraper.is_logged_in and not _worker_scraper.login():
+        return term, "error"
+    return term, _worker_scraper.search_term(term)
+
+
+def load_cookies(path):
+    """
+    Load session cookies saved by MedicalDictionaryScraper.bootstrap_cookies.
+    
+    Args:
+        path (str): JSON file with the cookies
+        
+    Returns:
+        dict: Cookie names mapped to values
+    """
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+async def search_terms_async(terms, cookies, concurrency=HTTP_CONCURRENCY,
+                             url="https://www.terveysportti.fi/apps/sanakirjat/"):
+    """
+    Search terms over HTTP with an authenticated session, without a browser.
+    Requires the optional httpx package.
+    
+    Args:
+        terms (list): List of Finnish medical terms to search
+        cookies (dict): Session cookies from bootstrap_cookies or load_cookies
+        concurrency (int): Maximum number of requests in flight
+        url (str): Dictionary search URL, queried with the term as "q"
+        
+    Returns:
+        dict: Dictionary mapping terms to their status ("found", "not found" or "error")
+    """
+    if httpx is None:
+        raise ImportError("search_terms_async requires httpx: pip install httpx")
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async with httpx.AsyncClient(cookies=cookies, follow_redirects=True, timeout=10) as client:
+        async def search(term):
+            async with semaphore:
+                try:
+                    response = await client.get(url, params={"q": term})
+                    response.raise_for_status()
+                except httpx.HTTPError as e:
+                    logger.error("Error searching for term '%s': %s", term, e)
+                    return "error"
+            
+            # Expired cookies are redirected to the login page, which would classify as "found"
+            final_url = str(response.url)
+            if not final_url.startswith(url.rstrip("/")) or "/apps/duoauth/" in final_url:
+                logger.error("Session expired while searching for term '%s'", term)
+                return "error"
+            
+            # A client-rendered page without any result marker tells nothing about the term
+            status = classify_result_text(response.text, default="error")
+            if status == "error":
+                logger.error("No search results in the response for term '%s'", term)
+            return status
+        
+        statuses = await asyncio.gather(*(search(term) for term in terms))
+    
+    return dict(zip(terms, statuses))
+
+
+# Quit pooled browsers when the interpreter exits
+atexit.register(MedicalDictionaryScraper.close_pooled_drivers)
+
+
+def configure_logging(level=logging.INFO):
+    """
+    Send progress messages to stdout. When stdout is redirected to a file or
+    pipe, messages are buffered and written in batches.
+    
+    Args:
+        level (int): Minimum level to show, e.g. logging.DEBUG for login steps
+    """
+    logger.setLevel(level)
+    if logger.handlers:
+        # Already configured; another handler would print every message twice
+        return
+    
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    if not sys.stdout.isatty():
+        # Flush when full, on warnings and errors, and at exit
+        handler = logging.handlers.MemoryHandler(
+            capacity=100, flushLevel=logging.WARNING, target=handler
+        )
+    logger.addHandler(handler)
+
+
 def main():
     """Example usage of the scraper."""
+    configure_logging()
+    
     # Login credentials
     EMAIL = ""
     PASSWORD = ""
@@ -213,13 +978,17 @@ def main():
     # Example search terms
     search_terms = ["Kirjasto", "lääkäri", "Sydän", "lentokone"]
 
-    print("Starting Medical Dictionary Scraper...")
-    print(f"Searching for {len(search_terms)} terms\n")
+    logger.info("Starting Medical Dictionary Scraper...")
+    logger.info("Searching for %d terms\n", len(search_terms))
     
     # Use context manager to ensure browser closes properly
     with MedicalDictionaryScraper(email=EMAIL, password=PASSWORD, headless=False) as scraper:
         results = scraper.search_multiple_terms(search_terms)
     
+    # Write out buffered progress before the results
+    for handler in logger.handlers:
+        handler.flush()
+    
     # Display results
     print("\n" + "="*50)
     print("RESULTS:")
@@ -0,0 +1,243 @@
+"""
+Tests for the browser-independent parts of the Medical Dictionary Scraper.
+"""
+
+import asyncio
+import itertools
+import json
+import shutil
+import subprocess
+
+import pytest
+
+import medical_dictionary_scraper as scraper_module
+from medical_dictionary_scraper import classify_result_text
+
+
+def baseline_classify(page_source):
+    """The result checks as originally done on driver.page_source."""
+    if "Ei tuloksia" in page_source:
+        return "not found"
+    if "Yhteensä" in page_source and "osumaa" in page_source:
+        return "found"
+    if "Lääketieteen termit" in page_source or "termit" in page_source.lower():
+        return "found"
+    page_source_lower = page_source.lower()
+    if "ei tuloksia" in page_source_lower or "ei löytynyt" in page_source_lower:
+        return "not found"
+    return "found"
+
+
+MARKER_FRAGMENTS = [
+    "Ei tuloksia", "ei tuloksia", "EI TULOKSIA",
+    "ei löytynyt", "Ei löytynyt", "EI LÖYTYNYT",
+    "Yhteensä", "yhteensä", "YHTEENSÄ",
+    "osumaa", "Osumaa",
+    "Lääketieteen termit", "TERMIT",
+    "lääkäri",
+]
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 3])
+def test_classify_result_text_matches_baseline_rules(size):
+    for fragments in itertools.permutations(MARKER_FRAGMENTS, size):
+        text = " ... ".join(fragments)
+        assert classify_result_text(text) == baseline_classify(text), text
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Ei tuloksia haulla kirjasto", "not found"),
+    ("Yhteensä 305 osumaa haulla lääkäri", "found"),
+    ("Lääketieteen termit", "found"),
+    ("Hakua ei löytynyt", "not found"),
+    # "Ei tuloksia" wins over any result marker
+    ("Ei tuloksia ... Yhteensä 3 osumaa ... Lääketieteen termit", "not found"),
+    # Lowercase "no results" loses to a section header
+    ("ei tuloksia ... termit", "found"),
+])
+def test_classify_result_text_priorities(text, expected):
+    assert classify_result_text(text) == expected
+
+
+def test_classify_result_text_default_without_markers():
+    shell = "<html><body><div id='root'></div></body></html>"
+    assert classify_result_text(shell) == "found"
+    assert classify_result_text(shell, default="error") == "error"
+
+
+def test_marker_regex_is_case_insensitive_for_finnish_letters():
+    assert {m.group(0) for m in scraper_module._RESULT_MARKER_RE.finditer("YHTEENSÄ EI LÖYTYNYT")} == {
+        "YHTEENSÄ", "EI LÖYTYNYT",
+    }
+
+
+class FakeDriver:
+    """Stands in for webdriver.Chrome where no browser calls are made."""
+    
+    def quit(self):
+        pass
+
+
+@pytest.fixture
+def scraper(monkeypatch):
+    """A logged-in scraper whose search_term records the terms it is called with."""
+    monkeypatch.setattr(scraper_module.MedicalDictionaryScraper, "_take_pooled_driver", lambda self: None)
+    monkeypatch.setattr(scraper_module.MedicalDictionaryScraper, "_create_driver", lambda self: FakeDriver())
+    
+    scraper = scraper_module.MedicalDictionaryScraper("user@example.com", "secret")
+    scraper.is_logged_in = True
+    scraper.searched = []
+    scraper.statuses = {}
+    
+    def search_term(term):
+        scraper.searched.append(term)
+        return scraper.statuses.get(term, "found")
+    
+    scraper.search_term = search_term
+    yield scraper
+    scraper.close(keep_alive=False)
+
+
+def test_search_multiple_terms_searches_normalized_duplicates_once(scraper):
+    results = scraper.search_multiple_terms(["Sydän", " sydän ", "SYDÄN", "keuhko"])
+    
+    assert scraper.searched == ["Sydän", "keuhko"]
+    assert results == {"Sydän": "found", " sydän ": "found", "SYDÄN": "found", "keuhko": "found"}
+
+
+def test_search_multiple_terms_answers_repeats_from_cache(scraper):
+    scraper.statuses = {"Kirjasto": "not found"}
+    scraper.search_multiple_terms(["Kirjasto", "lääkäri"])
+    scraper.searched.clear()
+    
+    results = scraper.search_multiple_terms(["kirjasto", "Lääkäri"])
+    
+    assert scraper.searched == []
+    assert results == {"kirjasto": "not found", "Lääkäri": "found"}
+
+
+def test_search_multiple_terms_does_not_cache_errors(scraper):
+    scraper.statuses = {"lentokone": "error"}
+    assert scraper.search_multiple_terms(["lentokone"]) == {"lentokone": "error"}
+    
+    scraper.statuses = {}
+    assert scraper.search_multiple_terms(["lentokone"]) == {"lentokone": "found"}
+    assert scraper.searched == ["lentokone", "lentokone"]
+
+
+def test_search_multiple_terms_keeps_cached_results_when_login_fails(scraper, monkeypatch):
+    scraper.search_multiple_terms(["Sydän"])
+    scraper.is_logged_in = False
+    monkeypatch.setattr(scraper, "login", lambda: False)
+    
+    results = scraper.search_multiple_terms(["sydän", "keuhko"])
+    
+    assert results == {"sydän": "found", "keuhko": "error"}
+
+
+def test_search_multiple_terms_rejects_tabs_with_workers(scraper):
+    with pytest.raises(ValueError):
+        scraper.search_multiple_terms(["Sydän"], workers=2, tabs=2)
+
+
+def test_cache_path_persists_results_between_scrapers(scraper, tmp_path):
+    cache_path = str(tmp_path / "terms.cache")
+    
+    first = scraper_module.MedicalDictionaryScraper("user@example.com", "secret", cache_path=cache_path)
+    first.is_logged_in = True
+    first.search_term = lambda term: "not found"
+    first.search_multiple_terms(["Kirjasto"])
+    first.close(keep_alive=False)
+    
+    second = scraper_module.MedicalDictionaryScraper("user@example.com", "secret", cache_path=cache_path)
+    second.search_term = lambda term: pytest.fail("cached term searched again")
+    try:
+        assert second.search_multiple_terms(["KIRJASTO"]) == {"KIRJASTO": "not found"}
+    finally:
+        second.close(keep_alive=False)
+
+
+DICTIONARY_URL = "https://www.terveysportti.fi/apps/sanakirjat/"
+
+
+@pytest.fixture
+def http_pages(monkeypatch):
+    """Serve search_terms_async from a dict of term -> (final URL, body) with httpx.MockTransport."""
+    httpx = pytest.importorskip("httpx")
+    pages = {}
+    
+    def handler(request):
+        term = request.url.params.get("q")
+        if term is None:
+            # Where redirects end up: the login page
+            return httpx.Response(200, text="<form id='login'>Kirjaudu</form>")
+        final_url, body = pages[term]
+        if final_url != DICTIONARY_URL:
+            return httpx.Response(302, headers={"Location": final_url})
+        return httpx.Response(200, text=body)
+    
+    client = httpx.AsyncClient
+    monkeypatch.setattr(
+        scraper_module.httpx, "AsyncClient",
+        lambda **kwargs: client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    return pages
+
+
+def test_search_terms_async_classifies_dictionary_pages(http_pages):
+    http_pages["lääkäri"] = (DICTIONARY_URL, "Yhteensä 305 osumaa haulla lääkäri")
+    http_pages["kirjasto"] = (DICTIONARY_URL, "Ei tuloksia haulla kirjasto")
+    
+    results = asyncio.run(scraper_module.search_terms_async(["lääkäri", "kirjasto"], cookies={}))
+    
+    assert results == {"lääkäri": "found", "kirjasto": "not found"}
+
+
+def test_search_terms_async_reports_expired_session_as_error(http_pages):
+    http_pages["lääkäri"] = ("https://www.terveysportti.fi/apps/duoauth/auth", "")
+    
+    results = asyncio.run(scraper_module.search_terms_async(["lääkäri"], cookies={}))
+    
+    assert results == {"lääkäri": "error"}
+
+
+def test_search_terms_async_reports_page_without_markers_as_error(http_pages):
+    http_pages["lääkäri"] = (DICTIONARY_URL, "<html><body><div id='root'></div></body></html>")
+    
+    results = asyncio.run(scraper_module.search_terms_async(["lääkäri"], cookies={}))
+    
+    assert results == {"lääkäri": "error"}
+
+
+def run_results_ready_script(text, previous, term):
+    """Evaluate RESULTS_READY_SCRIPT in Node.js against a page showing the given text."""
+    if shutil.which("node") is None:
+        pytest.skip("node is needed to run the in-browser script")
+    program = (
+        "const document = {querySelector: s => s === 'main' ? {innerText: %s} : null, body: null};\n"
+        "const window = {__previousResults: %s};\n"
+        "console.log(JSON.stringify((function () {%s}).apply(null, [%s])));\n"
+    ) % (json.dumps(text), json.dumps(previous), scraper_module.RESULTS_READY_SCRIPT, json.dumps(term))
+    completed = subprocess.run(["node", "-e", program], capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout)
+
+
+@pytest.mark.parametrize("text, term, expected", [
+    # The previous term's results are still shown
+    ("Yhteensä 12 osumaa haulla kirjasto", "Kirja", False),
+    ("Yhteensä 3 osumaa haulla lääkärit", "lääkäri", False),
+    # The header names the submitted term
+    ("Yhteensä 12 osumaa haulla kirja", "Kirja", True),
+    ("Yhteensä 305 osumaa haulla \"lääkäri\"\nLääketieteen termit", "Lääkäri", True),
+    ("Ei tuloksia haulla a.b", "a.b", True),
+    ("Ei tuloksia haulla axb", "a.b", False),
+])
+def test_results_ready_ignores_previous_results(text, term, expected):
+    # The text was already on screen before submitting, so only the header can tell
+    assert run_results_ready_script(text, previous=text, term=term) is expected
+
+
+def test_results_ready_accepts_changed_results():
+    previous = "Yhteensä 12 osumaa haulla kirjasto"
+    assert run_results_ready_script("Ei tuloksia", previous, "kirja") is True
+    assert run_results_ready_script("Ladataan...", previous, "kirja") is False